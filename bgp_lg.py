@@ -1,17 +1,31 @@
 """BGP Looking Glass library - worker functions and telnet client."""
 
 import asyncio
+import collections
+import functools
 import ipaddress
 import json
+import logging
 import os
 import re
+import socket
+import time
+import weakref
+from collections.abc import Coroutine
 from pathlib import Path
 from typing import Optional
 
 import httpx
 
+try:
+    import orjson
+except ImportError:  # optional - the stdlib parser is used instead
+    orjson = None
+
 from models import RouteLookupResponse, BGPSummaryResponse, BGPRoute
 
+logger = logging.getLogger(__name__)
+
 # Telnet protocol constants
 TELNET_IAC = 0xff  # Interpret As Command
 TELNET_DONT = 0xfe
@@ -21,6 +35,48 @@ TELNET_WILL = 0xfb
 TELNET_SB = 0xfa  # Subnegotiation
 TELNET_SE = 0xf0  # End of subnegotiation
 
+# Pre-built byte sequences used when scanning and answering negotiation
+IAC = bytes([TELNET_IAC])
+IAC_SE = bytes([TELNET_IAC, TELNET_SE])
+IAC_WONT = bytes([TELNET_IAC, TELNET_WONT])
+IAC_DONT = bytes([TELNET_IAC, TELNET_DONT])
+
+# Lower-cased server replies that mean the login was rejected
+AUTH_FAILURE_MARKERS = ("login invalid", "login incorrect", "authentication failed")
+
+# StreamReader buffer limit - large enough for a full BGP table response
+STREAM_LIMIT = 1 << 20
+
+# Parser for JSON documents read as bytes; orjson is much faster when installed
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Size of the reusable buffer the transport receives socket data into
+RECV_BUFFER_SIZE = 1 << 16
+
+# Seconds an idle session has to answer a keepalive
+KEEPALIVE_TIMEOUT = 5
+
+# Maximum logins in flight at once while pre-warming the pool
+PREWARM_CONCURRENCY = 16
+
+# Seconds pre-warming may take before logins still running are abandoned
+PREWARM_TIMEOUT = 30
+
+# Seconds a resolved server address is reused before looking it up again
+DNS_CACHE_TTL = 300
+
+
+@functools.lru_cache(maxsize=256)
+def _iac_wont(opt: int) -> bytes:
+    """Build the IAC WONT reply refusing a telnet option."""
+    return IAC_WONT + bytes((opt,))
+
+
+@functools.lru_cache(maxsize=256)
+def _iac_dont(opt: int) -> bytes:
+    """Build the IAC DONT reply declining a telnet option."""
+    return IAC_DONT + bytes((opt,))
+
 
 async def _http_request_with_retry(
     client: httpx.AsyncClient,
@@ -91,10 +147,95 @@ async def _http_request_with_retry(
     raise RuntimeError("HTTP request failed after retries")
 
 
+class _TelnetReaderProtocol(asyncio.StreamReaderProtocol, asyncio.BufferedProtocol):
+    """Stream protocol that strips telnet commands before the reader sees them.
+
+    Negotiation is answered as soon as it arrives, so the StreamReader buffer
+    only ever holds command output. Being a BufferedProtocol, the transport
+    receives into one reusable buffer instead of allocating bytes per read.
+    """
+
+    def __init__(self, reader: asyncio.StreamReader, negotiate):
+        super().__init__(reader)
+        self._negotiate = negotiate
+        self._telnet_transport: Optional[asyncio.Transport] = None
+        self._recv_buffer = bytearray(RECV_BUFFER_SIZE)
+        self._recv_view = memoryview(self._recv_buffer)
+        # Output bytes passed to the reader so far, for spotting unread data
+        self.bytes_received = 0
+
+    def connection_made(self, transport) -> None:
+        self._telnet_transport = transport
+        super().connection_made(transport)
+
+    def get_buffer(self, sizehint: int) -> memoryview:
+        return self._recv_view
+
+    def buffer_updated(self, nbytes: int) -> None:
+        if self._recv_buffer.find(IAC, 0, nbytes) < 0:
+            # Plain output goes straight from the receive buffer to the reader
+            self.bytes_received += nbytes
+            super().data_received(self._recv_view[:nbytes])
+        else:
+            self.data_received(bytes(self._recv_view[:nbytes]))
+
+    def data_received(self, data: bytes) -> None:
+        cleaned, telnet_response = self._negotiate(data)
+        if telnet_response and not self._telnet_transport.is_closing():
+            self._telnet_transport.write(telnet_response)
+        if cleaned:
+            self.bytes_received += len(cleaned)
+            super().data_received(cleaned)
+
+
+# Resolved addresses per (host, port), with the time they expire
+_dns_cache: dict[tuple[str, int], tuple[list[tuple[int, str]], float]] = {}
+
+
+async def _resolve(host: str, port: int) -> list[tuple[int, str]]:
+    """Look up the (family, address) pairs for a server, with caching.
+
+    Sessions to the same handful of servers are opened over and over, so
+    the lookup is only repeated every DNS_CACHE_TTL seconds.
+    """
+    key = (host, port)
+    now = time.monotonic()
+    entry = _dns_cache.get(key)
+    if entry is not None and entry[1] > now:
+        return entry[0]
+
+    infos = await asyncio.get_running_loop().getaddrinfo(
+        host, port, type=socket.SOCK_STREAM
+    )
+    addresses = [(family, sockaddr[0]) for family, _, _, _, sockaddr in infos]
+    _dns_cache[key] = (addresses, now + DNS_CACHE_TTL)
+    return addresses
+
 
 class TelnetClient:
     """Async telnet client for BGP looking-glass servers."""
 
+    # Pooled sessions are long-lived and numerous, so skip the per-instance dict
+    __slots__ = (
+        "host",
+        "port",
+        "username",
+        "password",
+        "prompt",
+        "timeout",
+        "pipeline_auth",
+        "reader",
+        "writer",
+        "_prompt_bytes",
+        "_pager_markers",
+        "_prompt_line",
+        "_synced",
+        "_loop",
+        "_protocol",
+        "_bytes_read",
+        "pool_key",
+    )
+
     def __init__(
         self,
         host: str,
@@ -103,6 +244,7 @@ class TelnetClient:
         password: str = "",
         prompt: str = "#",
         timeout: int = 15,
+        pipeline_auth: bool = True,
     ):
         """Initialize telnet client.
 
@@ -113,6 +255,9 @@ class TelnetClient:
             password: Login password.
             prompt: Command prompt indicator.
             timeout: Connection timeout in seconds.
+            pipeline_auth: Send username and password in one write instead of
+                waiting for each login prompt. Disable for servers that
+                discard input sent before their password prompt.
         """
         self.host = host
         self.port = port
@@ -120,8 +265,43 @@ class TelnetClient:
         self.password = password
         self.prompt = prompt
         self.timeout = timeout
+        self.pipeline_auth = pipeline_auth
         self.reader: Optional[asyncio.StreamReader] = None
         self.writer: Optional[asyncio.StreamWriter] = None
+        self._prompt_bytes = prompt.encode()
+        self._pager_markers = (b"---(more)---", b"---(")
+        # Full prompt line (e.g. b"route-views>"), learned after login
+        self._prompt_line: Optional[bytes] = None
+        # Whether the last read ended at the prompt, leaving nothing unread
+        self._synced = False
+        # Event loop the connection was opened on (weak, so it can be collected)
+        self._loop: Optional[weakref.ref] = None
+        # Protocol feeding the reader, and how much of its output was read
+        self._protocol: Optional[_TelnetReaderProtocol] = None
+        self._bytes_read = 0
+        # Key of the ConnectionPool entry this session belongs to, set once
+        # by the pool so it is not rebuilt on every release
+        self.pool_key: Optional[tuple] = None
+
+    @classmethod
+    def from_config(cls, server_config: dict) -> "TelnetClient":
+        """Create a client for a server entry from config.json.
+
+        Args:
+            server_config: Server configuration dict.
+
+        Returns:
+            Unconnected TelnetClient.
+        """
+        return cls(
+            host=server_config["host"],
+            port=server_config.get("port", 23),
+            username=server_config.get("username", ""),
+            password=server_config.get("password", ""),
+            prompt=server_config.get("prompt", "#"),
+            timeout=server_config.get("timeout", 15),
+            pipeline_auth=server_config.get("pipeline_auth", True),
+        )
 
     def _handle_telnet_negotiation(self, data: bytes) -> tuple[bytes, bytes]:
         """Handle telnet protocol negotiation.
@@ -134,87 +314,126 @@ class TelnetClient:
         Returns:
             Tuple of (cleaned_data, response_bytes)
         """
-        response = b""
-        i = 0
-        cleaned = b""
-        
-        while i < len(data):
-            if data[i:i+1] == bytes([TELNET_IAC]) and i + 1 < len(data):
-                cmd = data[i + 1]
-                
+        # Collect slices and join once at the end, so the output is
+        # allocated at its final size instead of grown piece by piece
+        cleaned: list = []
+        response: list = []
+        view = memoryview(data)
+        length = len(data)
+        pos = 0
+
+        # Copy runs of plain data in one slice and only interpret the bytes
+        # at each IAC position, instead of walking the buffer byte by byte.
+        while pos < length:
+            idx = data.find(IAC, pos)
+            if idx < 0:
+                cleaned.append(view[pos:])
+                break
+            cleaned.append(view[pos:idx])
+
+            if idx + 1 >= length:
+                # Lone IAC at the end of the chunk - keep it as data
+                cleaned.append(IAC)
+                break
+
+            cmd = data[idx + 1]
+            if cmd in (TELNET_DO, TELNET_DONT, TELNET_WILL, TELNET_WONT) and idx + 2 < length:
+                opt = data[idx + 2]
                 if cmd == TELNET_DO:
-                    # Server asking if we support an option
-                    if i + 2 < len(data):
-                        opt = data[i + 2]
-                        # Respond with WONT (we don't support most options)
-                        response += bytes([TELNET_IAC, TELNET_WONT, opt])
-                        i += 3
-                        continue
-                        
-                elif cmd == TELNET_DONT:
-                    # Server saying not to use an option
-                    if i + 2 < len(data):
-                        i += 3
-                        continue
-                        
+                    # Server asking if we support an option - we don't
+                    response.append(_iac_wont(opt))
                 elif cmd == TELNET_WILL:
-                    # Server saying it will use an option
-                    if i + 2 < len(data):
-                        opt = data[i + 2]
-                        # Respond with DONT (we don't want most options)
-                        response += bytes([TELNET_IAC, TELNET_DONT, opt])
-                        i += 3
-                        continue
-                        
-                elif cmd == TELNET_WONT:
-                    # Server saying it won't use an option
-                    if i + 2 < len(data):
-                        i += 3
-                        continue
-                        
-                elif cmd == TELNET_SB:
-                    # Subnegotiation - skip until SE
-                    i += 2
-                    while i < len(data) and not (data[i:i+1] == bytes([TELNET_IAC]) and i + 1 < len(data) and data[i + 1] == TELNET_SE):
-                        i += 1
-                    if i < len(data):
-                        i += 2
-                    continue
-                else:
-                    cleaned += data[i:i+1]
-                    i += 1
-                    continue
-            
-            cleaned += data[i:i+1]
-            i += 1
-        
-        return cleaned, response
+                    # Server saying it will use an option - we don't want it
+                    response.append(_iac_dont(opt))
+                pos = idx + 3
+            elif cmd == TELNET_SB:
+                # Subnegotiation - skip until IAC SE
+                end = data.find(IAC_SE, idx + 2)
+                pos = length if end < 0 else end + 2
+            else:
+                cleaned.append(IAC)
+                pos = idx + 1
+
+        return b"".join(cleaned), b"".join(response)
 
     async def connect(self) -> None:
         """Connect to telnet server and authenticate."""
         try:
-            self.reader, self.writer = await asyncio.wait_for(
-                asyncio.open_connection(self.host, self.port),
+            loop = asyncio.get_running_loop()
+            reader = asyncio.StreamReader(limit=STREAM_LIMIT, loop=loop)
+            protocol = _TelnetReaderProtocol(reader, self._handle_telnet_negotiation)
+            transport = await asyncio.wait_for(
+                self._open_transport(lambda: protocol),
                 timeout=self.timeout,
             )
+            self.reader = reader
+            self.writer = asyncio.StreamWriter(transport, protocol, reader, loop)
+            self._loop = weakref.ref(loop)
+            self._protocol = protocol
+            self._bytes_read = 0
+
+            # Commands are a few bytes followed by a wait for the reply, so
+            # don't let Nagle hold them back waiting for a delayed ACK
+            sock = transport.get_extra_info("socket")
+            if sock is not None:
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
 
             # Read initial banner/prompt
-            banner = await self._read_until_prompt(max_wait=15, require_prompt=False)
+            response = await self._read_until_prompt(max_wait=15, require_prompt=False)
 
             # Authenticate if credentials provided
-            if self.username:
-                await self._send_command(self.username)
+            if self.pipeline_auth and (self.username or self.password):
+                # Send the credentials back to back and wait for the prompt
+                # once, rather than a round trip per login prompt
+                await self._send_many([c for c in (self.username, self.password) if c])
                 response = await self._read_until_prompt(max_wait=self.timeout)
+                if any(marker in response.lower() for marker in AUTH_FAILURE_MARKERS):
+                    raise ConnectionError("Login rejected")
+            else:
+                if self.username:
+                    await self._send_command(self.username)
+                    response = await self._read_until_prompt(max_wait=self.timeout)
 
-            if self.password:
-                await self._send_command(self.password)
-                response = await self._read_until_prompt(max_wait=self.timeout)
+                if self.password:
+                    await self._send_command(self.password)
+                    response = await self._read_until_prompt(max_wait=self.timeout)
+
+            # Consume the initial prompt so it is not mistaken for the end of
+            # the first command's output, then remember the full prompt line
+            if not self._synced:
+                try:
+                    response = await self._read_until_prompt(max_wait=self.timeout)
+                except ConnectionError:
+                    pass
+            if self._synced:
+                self._prompt_line = response.rsplit("\n", 1)[-1].strip().encode()
 
         except asyncio.TimeoutError:
             raise ConnectionError(f"Timeout connecting to {self.host}:{self.port}")
         except Exception as e:
             raise ConnectionError(f"Failed to connect to {self.host}: {str(e)}")
 
+    async def _open_transport(self, protocol_factory) -> asyncio.Transport:
+        """Open a TCP connection using the cached addresses for the host.
+
+        Addresses are tried in resolver order. If none of them accept the
+        connection the cached entry is dropped, so the next attempt looks
+        the host up again in case it has moved.
+        """
+        loop = asyncio.get_running_loop()
+        last_error: Optional[OSError] = None
+        for family, address in await _resolve(self.host, self.port):
+            try:
+                transport, _ = await loop.create_connection(
+                    protocol_factory, address, self.port, family=family
+                )
+                return transport
+            except OSError as e:
+                last_error = e
+
+        _dns_cache.pop((self.host, self.port), None)
+        raise last_error or OSError(f"No addresses found for {self.host}")
+
     async def _send_command(self, command: str) -> None:
         """Send a command to the server."""
         if not self.writer:
@@ -225,6 +444,26 @@ class TelnetClient:
         self.writer.write(command_bytes)
         await self.writer.drain()
 
+    async def _send_many(self, commands: list[str]) -> None:
+        """Send several commands in a single write."""
+        if not self.writer:
+            raise ConnectionError("Not connected")
+
+        self.writer.write("".join(f"{command}\n" for command in commands).encode())
+        await self.writer.drain()
+
+    def _at_prompt(self, output: bytearray) -> bool:
+        """Check whether output ends with the server's prompt.
+
+        Only the last line is considered: the prompt character also appears
+        inside BGP output (e.g. '*>' best-path markers), so a match anywhere
+        else does not mean the response is complete.
+        """
+        last_line = output[output.rfind(b"\n") + 1:].strip()
+        if self._prompt_line is not None:
+            return last_line == self._prompt_line
+        return last_line.endswith(self._prompt_bytes)
+
     async def _read_until_prompt(self, max_wait: int = 5, require_prompt: bool = True) -> str:
         """Read from server until prompt is found or timeout.
         
@@ -235,85 +474,79 @@ class TelnetClient:
         if not self.reader:
             raise ConnectionError("Not connected")
 
-        output = b""
-        bytes_read = 0
-        start_time = asyncio.get_event_loop().time()
-        read_timeout = 1.0
-        had_data = False
-        
+        output = bytearray()
+        self._synced = False
+
         try:
-            while True:
-                try:
-                    # Use shorter individual read timeout
-                    chunk = await asyncio.wait_for(
-                        self.reader.read(4096),
-                        timeout=read_timeout,
-                    )
-                    
-                    if not chunk:
-                        break
-
-                    bytes_read += len(chunk)
-                    had_data = True
-                    
-                    # Handle telnet negotiation
-                    cleaned, telnet_response = self._handle_telnet_negotiation(chunk)
-                    
-                    if telnet_response and self.writer:
-                        self.writer.write(telnet_response)
-                        await self.writer.drain()
-                    
-                    if cleaned:
-                        output += cleaned
-
-                    # Check for pager output and handle it
-                    decoded_partial = output.decode(errors="replace")
-                    if "---(more)---" in decoded_partial or "---(" in decoded_partial:
-                        if self.writer:
-                            self.writer.write(b"q")
-                            await self.writer.drain()
-                        # Clear the more marker from output
-                        output = output.replace(b"---(more)---", b"")
-                        continue
-
-                    # Check if prompt is in output
-                    if self.prompt.encode() in output:
-                        break
-                    elif cleaned and not require_prompt:
-                        # For banner-like responses, return after getting some data
-                        break
-                        
-                except asyncio.TimeoutError:
-                    elapsed = asyncio.get_event_loop().time() - start_time
-                    
-                    # If we haven't received any data yet, keep waiting
-                    if not had_data:
-                        if elapsed > max_wait:
-                            raise ConnectionError(f"No response from server within {max_wait}s")
-                        continue
-                    
-                    # If we have data but no prompt, and we don't require prompt, return it
-                    if output and not require_prompt:
-                        break
-                    
-                    # If we have data but still waiting for prompt
-                    if output:
-                        if elapsed > max_wait:
-                            break
-                        continue
-                    
-                    # No data and no prompt yet
-                    if elapsed > max_wait:
-                        raise ConnectionError(f"No response from server within {max_wait}s")
-                    continue
-                         
+            # One deadline covers the whole response, rather than a timer
+            # and a wrapper task for every chunk read. Output collected
+            # before the deadline is kept in the shared buffer
+            await asyncio.wait_for(
+                self._read_into(output, require_prompt),
+                timeout=max_wait,
+            )
         except asyncio.TimeoutError:
+            # Deadline reached - return what arrived, if anything
             if not output:
                 raise ConnectionError(f"No response from server within {max_wait}s")
 
         decoded = output.decode(errors="replace").strip()
         return decoded
 
+    async def _read_into(self, output: bytearray, require_prompt: bool) -> None:
+        """Append server output to a buffer until the prompt comes back.
+
+        Args:
+            output: Buffer to append to.
+            require_prompt: If False, return after getting some data.
+        """
+        pager_marker, pager_prefix = self._pager_markers
+
+        while True:
+            # The read returns as soon as anything arrives, so there is no
+            # need to poll. Take whatever is buffered (up to the stream
+            # limit) in one call so a large table is handled in few
+            # iterations
+            chunk = await self.reader.read(STREAM_LIMIT)
+            if not chunk:
+                if require_prompt:
+                    # The server hung up before finishing; a pooled session
+                    # it dropped while idle ends up here on its next use
+                    raise ConnectionError("Connection closed by server")
+                return
+
+            # Telnet negotiation has already been stripped by the protocol
+            self._bytes_read += len(chunk)
+            output += chunk
+
+            # Check for pager output and handle it (markers are ASCII,
+            # so search the raw bytes rather than decoding the buffer).
+            # Every marker starts with the short one, and only the new
+            # chunk plus enough overlap for a marker split across two
+            # chunks needs scanning, rather than the whole buffer
+            scan_from = max(0, len(output) - len(chunk) - len(pager_marker) + 1)
+            if output.find(pager_prefix, scan_from) >= 0:
+                if self.writer:
+                    # A single keystroke never reaches the write
+                    # buffer's high-water mark, so skip the drain
+                    # and go straight back to reading
+                    self.writer.write(b"q")
+                # Clear the more marker from output in place rather
+                # than copying the whole buffer
+                idx = output.find(pager_marker, scan_from)
+                while idx >= 0:
+                    del output[idx:idx + len(pager_marker)]
+                    idx = output.find(pager_marker, idx)
+                continue
+
+            # Check if the server is back at its prompt
+            if self._at_prompt(output):
+                self._synced = True
+                return
+            if not require_prompt:
+                # For banner-like responses, return after getting some data
+                return
+
     async def send_command(self, command: str) -> str:
         """Send a command and get the response.
 
@@ -333,6 +566,70 @@ class TelnetClient:
         except Exception as e:
             raise
 
+    async def keepalive(self) -> None:
+        """Send an empty line and read back the prompt to keep the session open.
+
+        The reply is consumed rather than decoded and returned, and a server
+        that does not answer within KEEPALIVE_TIMEOUT is treated as gone.
+        """
+        if not self.writer:
+            raise ConnectionError("Not connected")
+
+        # Until the reply has been read the session is not at a clean
+        # prompt; if the probe is cancelled part way (the pool hands the
+        # session out mid-probe), is_reusable() must then turn it away
+        self._synced = False
+        self.writer.write(b"\n")
+        await self.writer.drain()
+        # The prompt must still be read back, or it would be left in the
+        # buffer in front of the next command's output
+        await self._read_until_prompt(max_wait=KEEPALIVE_TIMEOUT)
+        if not self._synced:
+            raise ConnectionError("No prompt in reply to keepalive")
+
+    def is_alive(self) -> bool:
+        """Check whether the connection is open, without any I/O.
+
+        A server closing its end does not close the transport, which stays
+        half-open, so the reader is checked for end of file as well.
+        """
+        return (
+            self.writer is not None
+            and not self.writer.is_closing()
+            and not self.reader.at_eof()
+        )
+
+    @property
+    def at_prompt(self) -> bool:
+        """Whether the last read ended at the prompt.
+
+        False after a read cut short by the timeout, whose output may be
+        incomplete.
+        """
+        return self._synced
+
+    def has_unread_output(self) -> bool:
+        """Check whether output has arrived that no read has consumed yet."""
+        return self._protocol is not None and self._protocol.bytes_received > self._bytes_read
+
+    def is_reusable(self) -> bool:
+        """Check whether the session is open, idle at the prompt and usable here.
+
+        A session holding unread output is out of step with its commands:
+        the next read would return that output as the next answer.
+
+        Streams can only be used from the event loop that opened them, which
+        is compared by identity so a new loop reusing a dead one's id() is
+        not mistaken for it.
+        """
+        return (
+            self.is_alive()
+            and self.at_prompt
+            and not self.has_unread_output()
+            and self._loop is not None
+            and self._loop() is asyncio.get_running_loop()
+        )
+
     async def close(self) -> None:
         """Close the connection."""
         if self.writer:
@@ -352,6 +649,520 @@ class TelnetClient:
         await self.close()
 
 
+class _ServerSlots:
+    """Pool state for one server, kept together so each operation needs a
+    single dict lookup."""
+
+    __slots__ = ("idle", "in_use", "waiters")
+
+    def __init__(self):
+        # Idle (session, returned at) pairs in return order. The newest is
+        # handed out first and the oldest expires first, so both ends are O(1)
+        self.idle: collections.deque = collections.deque()
+        # Sessions currently acquired
+        self.in_use = 0
+        # Acquires waiting for a slot, oldest first. Each future resolves to
+        # a session handed straight over, or None to connect a new one
+        self.waiters: collections.deque = collections.deque()
+
+    def __bool__(self) -> bool:
+        return bool(self.idle or self.in_use or self.waiters)
+
+
+class ConnectionPool:
+    """Pool of logged-in telnet sessions reused across commands.
+
+    Idle sessions are kept per (host, port, username, event loop), so only
+    the first command to a server pays for the TCP handshake and login.
+    Each idle session runs a keepalive task so the server does not drop it.
+    State is per server, so busy servers never hold up queries to others.
+    """
+
+    def __init__(
+        self,
+        max_idle: int = 2,
+        keepalive_interval: float = 30.0,
+        max_connections: int = 4,
+        pool_timeout: float = 30.0,
+        idle_timeout: float = 300.0,
+    ):
+        """Initialize connection pool.
+
+        Args:
+            max_idle: Maximum idle sessions kept per server.
+            keepalive_interval: Seconds between keepalives on idle sessions.
+            max_connections: Maximum sessions in use at once per server;
+                further acquires wait, first come first served, for one to
+                be handed back.
+            pool_timeout: Seconds an acquire waits for a free session.
+            idle_timeout: Seconds an unused session is kept before closing.
+        """
+        self.max_idle = max_idle
+        self.keepalive_interval = keepalive_interval
+        self.max_connections = max_connections
+        self.pool_timeout = pool_timeout
+        self.idle_timeout = idle_timeout
+        self._servers: collections.defaultdict[tuple, _ServerSlots] = (
+            collections.defaultdict(_ServerSlots)
+        )
+        self._keepalives: dict[TelnetClient, asyncio.Task] = {}
+        self._closing: set[asyncio.Task] = set()
+        self._prewarming: Optional[asyncio.Future] = None
+
+    @staticmethod
+    def _key(host: str, port: int, username: str) -> tuple:
+        """Build the pool key - sessions are bound to the loop that opened them."""
+        return (host, port, username, id(asyncio.get_running_loop()))
+
+    async def acquire(self, server_config: dict) -> TelnetClient:
+        """Get a logged-in session for a server, connecting if none is idle.
+
+        Args:
+            server_config: Server configuration dict.
+
+        Returns:
+            Connected TelnetClient, to be handed back with release() or discard().
+
+        Raises:
+            ConnectionError: If no session is free within pool_timeout, or
+                connecting fails.
+        """
+        key = self._key(
+            server_config["host"],
+            server_config.get("port", 23),
+            server_config.get("username", ""),
+        )
+        slots = self._servers[key]
+        if slots.in_use < self.max_connections:
+            slots.in_use += 1
+            client = self._take_idle(key, slots)
+        else:
+            client = await self._wait_for_slot(key, slots)
+            if client is not None:
+                return client
+
+        try:
+            if client is None:
+                client = await self._connect(key, server_config)
+        except BaseException:
+            self._return_slot(key, None)
+            raise
+        return client
+
+    @staticmethod
+    async def _connect(key: tuple, server_config: dict) -> TelnetClient:
+        """Open and log in a new session for a pool entry."""
+        client = TelnetClient.from_config(server_config)
+        client.pool_key = key
+        try:
+            await client.connect()
+        except BaseException:
+            # Don't leave the socket of a failed or abandoned login open
+            if client.writer:
+                client.writer.close()
+            raise
+        return client
+
+    async def _wait_for_slot(self, key: tuple, slots: _ServerSlots) -> Optional[TelnetClient]:
+        """Queue for a slot held by another caller and take it over."""
+        future = asyncio.get_running_loop().create_future()
+        slots.waiters.append(future)
+        try:
+            return await asyncio.wait_for(future, timeout=self.pool_timeout)
+        except BaseException as e:
+            # A slot handed over just as the wait ended must be passed on,
+            # or it (and its session) would be lost for good
+            if future.done() and not future.cancelled():
+                self._return_slot(key, future.result())
+            if isinstance(e, asyncio.TimeoutError):
+                raise ConnectionError(
+                    f"No free session to {key[0]} within {self.pool_timeout}s"
+                ) from None
+            raise
+
+    def _take_idle(self, key: tuple, slots: _ServerSlots) -> Optional[TelnetClient]:
+        """Pop an idle session that is still usable, without any I/O.
+
+        Sessions found dead are closed in the background, so a stale entry
+        never delays the caller.
+        """
+        idle = slots.idle
+        while idle:
+            client, _ = idle.pop()
+            self._stop_keepalive(client)
+            if client.is_reusable():
+                return client
+            self._close_soon(client)
+        return None
+
+    def _close_soon(self, client: TelnetClient) -> None:
+        """Close a session in the background."""
+        task = asyncio.create_task(client.close())
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    async def release(self, client: TelnetClient) -> None:
+        """Return a session to the pool after a completed command.
+
+        Args:
+            client: Session obtained from acquire().
+        """
+        self._return_slot(client.pool_key, client)
+
+    def _return_slot(self, key: tuple, client: Optional[TelnetClient]) -> None:
+        """Give up an in-use slot, along with its session if still usable.
+
+        The oldest waiter takes over the slot and the session directly,
+        otherwise the slot is freed and the session parked as idle.
+        """
+        if client is not None and not client.is_reusable():
+            self._close_soon(client)
+            client = None
+
+        slots = self._servers[key]
+        waiters = slots.waiters
+        while waiters:
+            future = waiters.popleft()
+            if not future.done():
+                future.set_result(client)
+                return
+
+        slots.in_use -= 1
+        if client is not None:
+            self._park(key, client)
+        elif not slots:
+            del self._servers[key]
+
+    def _park(self, key: tuple, client: TelnetClient) -> None:
+        """Add a session to the idle pool, or close it if it cannot be kept."""
+        if not client.is_reusable():
+            self._close_soon(client)
+            return
+
+        idle = self._servers[key].idle
+        if len(idle) >= self.max_idle:
+            self._close_soon(client)
+            return
+
+        idle.append((client, asyncio.get_running_loop().time()))
+        self._keepalives[client] = asyncio.create_task(self._keepalive(key, client))
+
+    def _evict_stale(self, key: tuple) -> None:
+        """Close a server's expired idle sessions, oldest first."""
+        slots = self._servers.get(key)
+        if slots is None:
+            return
+
+        idle = slots.idle
+        expired_before = asyncio.get_running_loop().time() - self.idle_timeout
+        while idle and idle[0][1] <= expired_before:
+            client, _ = idle.popleft()
+            self._stop_keepalive(client)
+            self._close_soon(client)
+        if not slots:
+            del self._servers[key]
+
+    async def prewarm(self, server_configs: list, per_server: int = 1) -> None:
+        """Open sessions ahead of the first query so it skips the login.
+
+        Servers that already have idle sessions are only topped up. Servers
+        that cannot be reached are logged and skipped. A call made while a
+        pre-warm is already under way waits for that one instead.
+
+        Args:
+            server_configs: Server configuration dicts to connect to.
+            per_server: Number of idle sessions to hold per server.
+        """
+        # Sessions still connecting are not idle yet, so a second pre-warm
+        # run alongside would open a duplicate set of logins
+        running = self._prewarming
+        if (
+            running is not None
+            and not running.done()
+            and running.get_loop() is asyncio.get_running_loop()
+        ):
+            await running
+            return
+
+        self._prewarming = asyncio.ensure_future(self._prewarm(server_configs, per_server))
+        await self._prewarming
+
+    async def _prewarm(self, server_configs: list, per_server: int) -> None:
+        """Log in to the servers that are short of idle sessions."""
+        # Connect to all servers at once, so startup takes as long as the
+        # slowest login rather than their sum, but cap the number of
+        # sockets opened together for large configs
+        limit = asyncio.Semaphore(PREWARM_CONCURRENCY)
+
+        async def spawn(key: tuple, server_config: dict) -> None:
+            async with limit:
+                client = await self._connect(key, server_config)
+            self._park(key, client)
+
+        spawns = {}
+        for server_config in server_configs:
+            key = self._key(
+                server_config["host"],
+                server_config.get("port", 23),
+                server_config.get("username", ""),
+            )
+            slots = self._servers.get(key)
+            idle = len(slots.idle) if slots is not None else 0
+            for _ in range(min(per_server, self.max_idle) - idle):
+                spawns[asyncio.ensure_future(spawn(key, server_config))] = server_config
+        if not spawns:
+            return
+
+        # A server that hangs mid-login must not hold up the rest for good
+        try:
+            done, pending = await asyncio.wait(spawns, timeout=PREWARM_TIMEOUT)
+        except BaseException:
+            for task in spawns:
+                task.cancel()
+            # Let the logins unwind, so that none can still park a session
+            # once the caller goes on to close the pool
+            await asyncio.wait(spawns)
+            raise
+        for task in pending:
+            task.cancel()
+            logger.warning(
+                "Gave up pre-warming %s after %ss", spawns[task].get("name"), PREWARM_TIMEOUT
+            )
+        if pending:
+            await asyncio.wait(pending)
+
+        for task in done:
+            if task.exception() is not None:
+                logger.warning("Failed to pre-warm %s: %s", spawns[task].get("name"), task.exception())
+
+    async def discard(self, client: TelnetClient) -> None:
+        """Close a session that failed or was left in an unknown state.
+
+        Args:
+            client: Session obtained from acquire().
+        """
+        self._stop_keepalive(client)
+        self._return_slot(client.pool_key, None)
+        await client.close()
+
+    async def close_all(self) -> None:
+        """Close all idle sessions."""
+        for task in self._keepalives.values():
+            task.cancel()
+        self._keepalives.clear()
+
+        # Close everything at once, so shutdown takes one round trip rather
+        # than one per session. Closes already running in the background
+        # are waited for too
+        clients = []
+        for key, slots in list(self._servers.items()):
+            clients.extend(client for client, _ in slots.idle)
+            slots.idle.clear()
+            if not slots:
+                del self._servers[key]
+        results = await asyncio.gather(
+            *(client.close() for client in clients),
+            *self._closing,
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.warning("Error closing session: %s", result)
+
+    def _stop_keepalive(self, client: TelnetClient) -> None:
+        """Cancel the keepalive task of a session leaving the idle pool."""
+        task = self._keepalives.pop(client, None)
+        if task is not None:
+            task.cancel()
+
+    async def _keepalive(self, key: tuple, client: TelnetClient) -> None:
+        """Periodically poke an idle session until it is acquired, expires or fails."""
+        try:
+            while True:
+                await asyncio.sleep(self.keepalive_interval)
+                self._evict_stale(key)
+                if client not in self._keepalives:
+                    return
+                await client.keepalive()
+        except ConnectionError:
+            # Leave the dead session in the pool; acquire() skips it
+            self._keepalives.pop(client, None)
+            await client.close()
+
+
+class TTLCache:
+    """Small LRU cache whose entries expire a fixed time after being stored."""
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60.0):
+        """Initialize cache.
+
+        Args:
+            maxsize: Maximum number of entries; the least recently used is
+                evicted first.
+            ttl: Seconds an entry stays valid. 0 disables caching.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: collections.OrderedDict = collections.OrderedDict()
+
+    def get(self, key):
+        """Return the cached value for key, or None if missing or expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+
+        value, expires = entry
+        if time.monotonic() >= expires:
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key, value) -> None:
+        """Store a value, evicting the least recently used entry if full."""
+        if self.ttl <= 0:
+            return
+
+        self._data[key] = (value, time.monotonic() + self.ttl)
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+
+# Global connection pool
+_pool: Optional[ConnectionPool] = None
+
+
+def get_pool() -> ConnectionPool:
+    """Get the process-wide connection pool, creating it on first use."""
+    global _pool
+
+    if _pool is None:
+        _pool = ConnectionPool()
+
+    return _pool
+
+
+# Global cache of recent route lookups
+_route_cache: Optional[TTLCache] = None
+
+
+def get_route_cache() -> TTLCache:
+    """Get the process-wide route lookup cache, creating it on first use.
+
+    Entries live for BGP_ROUTE_CACHE_TTL seconds (default 60, 0 disables
+    caching). Routes change on the order of minutes, so a client repeating
+    a question shortly after gets the earlier answer without a query.
+    """
+    global _route_cache
+
+    if _route_cache is None:
+        try:
+            ttl = float(os.getenv("BGP_ROUTE_CACHE_TTL", "60"))
+        except ValueError:
+            ttl = 60.0
+        _route_cache = TTLCache(maxsize=1024, ttl=ttl)
+
+    return _route_cache
+
+
+async def close_pool() -> None:
+    """Close all pooled sessions."""
+    global _pool
+
+    if _pool is not None:
+        await _pool.close_all()
+        _pool = None
+
+
+async def prewarm_pool() -> None:
+    """Open sessions to all enabled servers ahead of the first query.
+
+    The number of sessions per server is read from the BGP_PREWARM_SESSIONS
+    environment variable (default 1, 0 disables pre-warming).
+    """
+    try:
+        per_server = int(os.getenv("BGP_PREWARM_SESSIONS", "1"))
+    except ValueError:
+        per_server = 1
+    if per_server <= 0:
+        return
+
+    servers = [
+        server
+        for server in load_config().get("servers", [])
+        if server.get("enabled", True)
+    ]
+    await get_pool().prewarm(servers, per_server)
+
+
+def run_event_loop(main: Coroutine) -> None:
+    """Run a coroutine to completion, on uvloop when it is installed.
+
+    uvicorn already picks uvloop by itself for the HTTP transports; this
+    gives stdio mode and command-line scripts the same loop.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main)
+    else:
+        uvloop.run(main)
+
+
+# IPv4 ranges, as (first, last) integers, that cover every address
+# ipaddress treats as private, loopback or link-local in any supported
+# Python version. Addresses outside all of them are public; those inside
+# are left to ipaddress, whose exact lists differ between versions
+_IPV4_SPECIAL_RANGES = tuple(
+    (int(network.network_address), int(network.broadcast_address))
+    for network in map(
+        ipaddress.IPv4Network,
+        (
+            "0.0.0.0/8",
+            "10.0.0.0/8",
+            "100.64.0.0/10",
+            "127.0.0.0/8",
+            "169.254.0.0/16",
+            "172.16.0.0/12",
+            "192.0.0.0/24",
+            "192.0.2.0/24",
+            "192.168.0.0/16",
+            "198.18.0.0/15",
+            "198.51.100.0/24",
+            "203.0.113.0/24",
+            "240.0.0.0/4",
+        ),
+    )
+)
+
+
+# Translation table deleting every character that can appear in an
+# address or CIDR, so anything left over marks an invalid destination
+_ADDRESS_CHARS = str.maketrans("", "", "0123456789abcdefABCDEF.:/")
+
+# Names get_ip_type() reports for each IP version
+_IP_TYPES = {4: "IPv4", 6: "IPv6"}
+
+
+def _is_plain_public_ipv4(destination: str) -> bool:
+    """Check for a dotted-quad IPv4 address outside all special ranges.
+
+    inet_pton only accepts the canonical dotted-quad form (no leading
+    zeros or short forms), so anything it accepts is spelled exactly as
+    ipaddress would print it. False means "not known to be public", not
+    "invalid".
+    """
+    try:
+        value = int.from_bytes(socket.inet_pton(socket.AF_INET, destination), "big")
+    except OSError:
+        return False
+    for first, last in _IPV4_SPECIAL_RANGES:
+        if first <= value <= last:
+            return False
+    return True
+
+
 def validate_ip_or_cidr(destination: str) -> tuple[bool, str]:
     """Validate if destination is a valid public IPv4/IPv6 address or CIDR subnet.
 
@@ -361,7 +1172,43 @@ def validate_ip_or_cidr(destination: str) -> tuple[bool, str]:
     Returns:
         Tuple of (is_valid, message).
     """
-    destination = destination.strip()
+    # Strip before the cache so padded copies share one entry
+    is_valid, message, _ = _classify_destination(destination.strip())
+    return is_valid, message
+
+
+def get_ip_type(destination: str) -> str:
+    """Determine if address is IPv4 or IPv6.
+
+    Args:
+        destination: IP address or CIDR notation.
+
+    Returns:
+        "IPv4", "IPv6", or "unknown".
+    """
+    return _IP_TYPES.get(_classify_destination(destination)[2], "unknown")
+
+
+@functools.lru_cache(maxsize=4096)
+def _classify_destination(destination: str) -> tuple[bool, str, Optional[int]]:
+    """Parse a destination once for both validation and its IP version.
+
+    Returns:
+        Tuple of (is_valid, message, version). The version is set whenever
+        the destination parses, even if it is not public, and is None
+        otherwise.
+    """
+    # Reject anything with characters no address can contain without
+    # raising and catching ipaddress's ValueError; the message is the one
+    # ipaddress would give. IPv6 scope IDs after '%' may hold any character
+    if destination.partition("%")[0].translate(_ADDRESS_CHARS):
+        kind = "network" if "/" in destination else "address"
+        return (
+            False,
+            f"Invalid IP address or CIDR notation: "
+            f"{destination!r} does not appear to be an IPv4 or IPv6 {kind}",
+            None,
+        )
 
     try:
         # Try to parse as CIDR subnet first
@@ -370,45 +1217,32 @@ def validate_ip_or_cidr(destination: str) -> tuple[bool, str]:
             
             # Check if it's a public address (not private/reserved)
             if network.is_private or network.is_loopback or network.is_link_local:
-                return False, f"CIDR subnet {destination} is not public"
+                return False, f"CIDR subnet {destination} is not public", network.version
             
-            return True, f"Valid CIDR subnet: {network}"
+            return True, f"Valid CIDR subnet: {network}", network.version
         
+        # Most lookups are for ordinary public IPv4 addresses, which can be
+        # recognised with a strict parse and a few integer comparisons
+        if _is_plain_public_ipv4(destination):
+            return True, f"Valid IP address: {destination}", 4
+
         # Try to parse as individual IP address
         ip = ipaddress.ip_address(destination)
         
         # Check if it's a public address
         if ip.is_private or ip.is_loopback or ip.is_link_local:
-            return False, f"Address {destination} is not public"
+            return False, f"Address {destination} is not public", ip.version
         
-        return True, f"Valid IP address: {ip}"
+        return True, f"Valid IP address: {ip}", ip.version
     
     except ValueError as e:
-        return False, f"Invalid IP address or CIDR notation: {str(e)}"
-
-
-def get_ip_type(destination: str) -> str:
-    """Determine if address is IPv4 or IPv6.
-
-    Args:
-        destination: IP address or CIDR notation.
-
-    Returns:
-        "IPv4", "IPv6", or "unknown".
-    """
-    try:
-        if "/" in destination:
-            network = ipaddress.ip_network(destination, strict=False)
-            return "IPv6" if network.version == 6 else "IPv4"
-        
-        ip = ipaddress.ip_address(destination)
-        return "IPv6" if ip.version == 6 else "IPv4"
-    except ValueError:
-        return "unknown"
+        return False, f"Invalid IP address or CIDR notation: {str(e)}", None
 
 
 # Global config
 _config: Optional[dict] = None
+_config_by_name: dict[str, dict] = {}
+_available_servers: tuple[str, ...] = ()
 _config_path: Optional[Path] = None
 
 
@@ -436,7 +1270,7 @@ def load_config() -> dict:
     - CONFIG_PATH: Path to config.json file
     - BGP_SERVER_TIMEOUT: Default timeout for BGP connections (seconds)
     """
-    global _config
+    global _config, _config_by_name, _available_servers
     
     if _config is not None:
         return _config
@@ -444,8 +1278,8 @@ def load_config() -> dict:
     config_path = _get_config_path()
     
     try:
-        with open(config_path, "r") as f:
-            _config = json.load(f)
+        # Read the file in one call and parse the bytes directly
+        _config = _json_loads(config_path.read_bytes())
         
         # Apply environment variable overrides for server configuration
         timeout_override = os.getenv("BGP_SERVER_TIMEOUT")
@@ -458,6 +1292,17 @@ def load_config() -> dict:
                         server["_env_timeout_override"] = True
             except ValueError:
                 pass
+
+        # Index servers by name so lookups don't scan the list. The first
+        # entry wins if a name is repeated, as with the scan it replaces
+        _config_by_name = {}
+        for server in _config.get("servers", []):
+            _config_by_name.setdefault(server.get("name"), server)
+        _available_servers = tuple(
+            server.get("name")
+            for server in _config.get("servers", [])
+            if server.get("enabled", True)
+        )
         
         return _config
     except FileNotFoundError:
@@ -475,11 +1320,8 @@ def get_server_config(server_name: str) -> Optional[dict]:
     Returns:
         Server configuration dict or None if not found.
     """
-    config_data = load_config()
-    for server in config_data.get("servers", []):
-        if server.get("name") == server_name:
-            return server
-    return None
+    load_config()
+    return _config_by_name.get(server_name)
 
 
 def get_available_servers() -> list:
@@ -488,14 +1330,11 @@ def get_available_servers() -> list:
     Returns:
         List of enabled server names.
     """
-    config_data = load_config()
-    return [
-        server.get("name")
-        for server in config_data.get("servers", [])
-        if server.get("enabled", True)
-    ]
+    load_config()
+    return list(_available_servers)
 
 
+@functools.lru_cache(maxsize=1)
 def build_server_description() -> str:
     """Build a formatted description of available servers for tool docs.
 
@@ -519,10 +1358,33 @@ async def execute_bgp_command(server_name: str, command: str) -> str:
         command: BGP command to execute.
 
     Returns:
-        Server response with command output.
-    
+        Server response with command output. If the server did not finish
+        within its timeout, this is the output that arrived before then.
+
+    Raises:
+        ValueError: If server not found or disabled, or the command spans
+            more than one line.
+        RuntimeError: If connection or command execution fails.
+    """
+    response, _ = await execute_bgp_command_with_status(server_name, command)
+    return response
+
+
+async def execute_bgp_command_with_status(server_name: str, command: str) -> tuple[str, bool]:
+    """Execute a command on a BGP looking-glass server and report if it finished.
+
+    Args:
+        server_name: Name of the server to query.
+        command: BGP command to execute.
+
+    Returns:
+        Server response, and whether the read ended at the prompt. False
+        means the timeout cut the response short, so it may be truncated
+        and should not be kept for reuse.
+
     Raises:
-        ValueError: If server not found or disabled.
+        ValueError: If server not found or disabled, or the command spans
+            more than one line.
         RuntimeError: If connection or command execution fails.
     """
     server_config = get_server_config(server_name)
@@ -532,27 +1394,31 @@ async def execute_bgp_command(server_name: str, command: str) -> str:
     if not server_config.get("enabled", True):
         raise ValueError(f"Server '{server_name}' is disabled")
 
+    # Each line is a separate command to the server, and the extra answers
+    # would be left in the session for later queries to pick up
+    if "\n" in command or "\r" in command:
+        raise ValueError("Command must be a single line")
+
+    pool = get_pool()
     try:
-        # Create on-demand connection (fast enough for RouteViews servers)
-        client = TelnetClient(
-            host=server_config["host"],
-            port=server_config.get("port", 23),
-            username=server_config.get("username", ""),
-            password=server_config.get("password", ""),
-            prompt=server_config.get("prompt", "#"),
-            timeout=server_config.get("timeout", 15),
-        )
-        
-        # Connect
-        await client.connect()
-        
-        # Execute command
-        response = await client.send_command(command)
-        
-        # Close connection
-        await client.close()
-        
-        return response
+        # Reuse an idle session where possible. The server may have dropped
+        # a pooled session since its last use, so retry once on a new one.
+        for attempt in range(2):
+            client = await pool.acquire(server_config)
+            try:
+                response = await client.send_command(command)
+                complete = client.at_prompt
+            except ConnectionError:
+                await pool.discard(client)
+                if attempt:
+                    raise
+                continue
+            except BaseException:
+                await pool.discard(client)
+                raise
+
+            await pool.release(client)
+            return response, complete
         
     except Exception as e:
         raise RuntimeError(f"Failed to query {server_name}: {str(e)}")
@@ -649,6 +1515,20 @@ async def lookup_asn_owner(asn_input: str, timeout: int = 10) -> str:
 
 # BGP Output Parsing Functions
 
+# Patterns used by the parsers below, many of them once per output line,
+# compiled up front rather than looked up in re's cache on every call
+_ROUTE_LINE_RE = re.compile(r'^[>i*+\-#]?\s*\d+\.\d+\.\d+\.\d+')
+_NUMBER_RE = re.compile(r'\d+')
+_PING_SUCCESS_RE = re.compile(r"Success rate is (\d+) percent \((\d+)/(\d+)\)")
+_PING_RTT_RE = re.compile(r"round-trip min/avg/max = ([\d.]+)/([\d.]+)/([\d.]+) ms")
+_TRACE_TARGET_RE = re.compile(r"Tracing the route to ([\w.-]+) \([\d.]+\)")
+_TRACE_HOP_RE = re.compile(r"^\s*(\d+)\s+")
+_TRACE_HOST_RE = re.compile(r"([\w.-]+)\s+\(([\d.]+)\)(?:\s+\[AS\s+(\d+)\])?")
+_TRACE_IP_RE = re.compile(r"([\d.]+)")
+_TRACE_TIME_RE = re.compile(r"([\d.]+)\s+ms")
+_TRACE_TIMEOUT_RE = re.compile(r"^\s*\*[\s\*]*$")
+
+
 def _parse_bgp_route_lookup(output: str) -> RouteLookupResponse:
     """Parse 'show ip bgp <destination>' output to structured JSON.
     
@@ -668,7 +1548,7 @@ def _parse_bgp_route_lookup(output: str) -> RouteLookupResponse:
             continue
         
         # Look for BGP route lines (typically start with ">", "i", or similar)
-        if re.match(r'^[>i*+\-#]?\s*\d+\.\d+\.\d+\.\d+', line):
+        if _ROUTE_LINE_RE.match(line):
             # Extract prefix if present
             parts = line.split()
             if parts:
@@ -727,7 +1607,7 @@ def _parse_bgp_summary(output: str) -> BGPSummaryResponse:
         # Look for neighbor count indicators
         if 'neighbor' in line.lower() or 'peer' in line.lower():
             # Try to extract numbers from lines mentioning neighbors
-            numbers = re.findall(r'\d+', line)
+            numbers = _NUMBER_RE.findall(line)
             if numbers:
                 neighbor_count = max(neighbor_count, int(numbers[-1]))
     
@@ -831,7 +1711,7 @@ def _parse_ping_output(output: str) -> dict:
     
     # Extract success rate and packet counts
     # Format: "Success rate is 100 percent (5/5), ..."
-    success_match = re.search(r"Success rate is (\d+) percent \((\d+)/(\d+)\)", output)
+    success_match = _PING_SUCCESS_RE.search(output)
     if success_match:
         result["success_rate"] = int(success_match.group(1))
         result["received"] = int(success_match.group(2))
@@ -839,7 +1719,7 @@ def _parse_ping_output(output: str) -> dict:
     
     # Extract round-trip times
     # Format: "round-trip min/avg/max = 4/4/4 ms"
-    rtt_match = re.search(r"round-trip min/avg/max = ([\d.]+)/([\d.]+)/([\d.]+) ms", output)
+    rtt_match = _PING_RTT_RE.search(output)
     if rtt_match:
         result["min_ms"] = float(rtt_match.group(1))
         result["avg_ms"] = float(rtt_match.group(2))
@@ -876,7 +1756,7 @@ def _parse_traceroute_output(output: str, target_ip: str) -> dict:
     
     # Extract target hostname from first line
     # Format: "Tracing the route to hostname (IP)"
-    first_line_match = re.search(r"Tracing the route to ([\w.-]+) \([\d.]+\)", output)
+    first_line_match = _TRACE_TARGET_RE.search(output)
     if first_line_match:
         result["target_hostname"] = first_line_match.group(1)
     
@@ -888,7 +1768,7 @@ def _parse_traceroute_output(output: str, target_ip: str) -> dict:
             continue
         
         # Check if line starts with a hop number
-        hop_match = re.match(r"^\s*(\d+)\s+", line)
+        hop_match = _TRACE_HOP_RE.match(line)
         if hop_match:
             # If we have a previous hop, save it
             if current_hop is not None:
@@ -906,7 +1786,7 @@ def _parse_traceroute_output(output: str, target_ip: str) -> dict:
             
             # Extract hostname and IP
             # Format: "hostname (IP) [AS ASN] times"
-            host_match = re.search(r"([\w.-]+)\s+\(([\d.]+)\)(?:\s+\[AS\s+(\d+)\])?", line)
+            host_match = _TRACE_HOST_RE.search(line)
             if host_match:
                 current_hop["host"] = host_match.group(1)
                 current_hop["ip"] = host_match.group(2)
@@ -916,12 +1796,12 @@ def _parse_traceroute_output(output: str, target_ip: str) -> dict:
                 # Line might be IP only without hostname
                 # Look for IP after the hop number (skip the hop number itself)
                 remaining_line = line[hop_match.end():]  # Get everything after the hop number
-                ip_match = re.search(r"([\d.]+)", remaining_line)
+                ip_match = _TRACE_IP_RE.search(remaining_line)
                 if ip_match and remaining_line.strip() and not remaining_line.strip().startswith("*"):
                     current_hop["ip"] = ip_match.group(1)
             
             # Extract all times in milliseconds
-            time_matches = re.findall(r"([\d.]+)\s+ms", line)
+            time_matches = _TRACE_TIME_RE.findall(line)
             if time_matches:
                 current_hop["times_ms"] = [float(t) for t in time_matches]
                 # Calculate average RTT
@@ -931,7 +1811,7 @@ def _parse_traceroute_output(output: str, target_ip: str) -> dict:
             # Check for timeout markers (* * *)
             # This means the line is like "2  * * *"
             remaining_after_hop = line[hop_match.end():]
-            if "*" in remaining_after_hop and re.match(r"^\s*\*[\s\*]*$", remaining_after_hop):
+            if "*" in remaining_after_hop and _TRACE_TIMEOUT_RE.match(remaining_after_hop):
                 current_hop["host"] = "*"
                 current_hop["ip"] = None
     
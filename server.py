@@ -1,10 +1,18 @@
 """BGP Looking Glass MCP Server."""
 
+import argparse
+import asyncio
+import contextlib
+import functools
 import json
+import logging
 import os
-import sys
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Optional
 
 from mcp.server.fastmcp import FastMCP
+from starlette.applications import Starlette
 
 from bgp_lg import (
     validate_ip_or_cidr,
@@ -13,8 +21,13 @@ from bgp_lg import (
     get_server_config,
     get_available_servers,
     execute_bgp_command,
+    execute_bgp_command_with_status,
     lookup_asn_owner,
     lookup_ip_geolocation,
+    prewarm_pool,
+    close_pool,
+    run_event_loop,
+    get_route_cache,
     _parse_bgp_route_lookup,
     _parse_bgp_summary,
     _parse_ping_output,
@@ -34,6 +47,92 @@ from models import (
     TracerouteHop,
 )
 
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def pool_lifespan() -> AsyncIterator[None]:
+    """Pre-warm looking-glass sessions in the background, close them on exit.
+
+    Runs once per server process. FastMCP's own lifespan hook runs once per
+    client session over HTTP, so it is not used for this.
+    """
+    prewarm = asyncio.create_task(prewarm_pool())
+    prewarm.add_done_callback(_log_prewarm_failure)
+    try:
+        yield
+    finally:
+        prewarm.cancel()
+        # Let the warm-up unwind before closing the pool, or a login that
+        # completes in between would park a session in a pool already closed.
+        # A failure has been logged by the callback
+        with contextlib.suppress(asyncio.CancelledError, Exception):
+            await prewarm
+        await close_pool()
+
+
+def _log_prewarm_failure(task: asyncio.Task) -> None:
+    """Log why pre-warming failed, such as a missing config file."""
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("Failed to pre-warm sessions", exc_info=task.exception())
+
+
+def with_pool_lifespan(app: Starlette) -> Starlette:
+    """Run pool_lifespan() around an ASGI app's own startup and shutdown."""
+    app_lifespan = app.router.lifespan_context
+
+    @asynccontextmanager
+    async def lifespan(app: Starlette) -> AsyncIterator[None]:
+        async with pool_lifespan(), app_lifespan(app):
+            yield
+
+    app.router.lifespan_context = lifespan
+    return app
+
+
+# Route lookups currently running, keyed by (server, destination)
+_inflight: dict[tuple[str, str], asyncio.Task] = {}
+
+
+async def _lookup_route(server: str, destination: str) -> str:
+    """Run "show ip bgp" for a destination, sharing work between callers.
+
+    Callers asking the same question at the same time all await a single
+    query instead of each opening its own session. The recent lookup cache
+    is checked by route_lookup() before this is called.
+    """
+    key = (server, destination)
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_query_route(server, destination))
+        _inflight[key] = task
+        task.add_done_callback(lambda done: _forget_inflight(key, done))
+
+    # One caller giving up must not cancel the query for the others
+    return await asyncio.shield(task)
+
+
+async def _query_route(server: str, destination: str) -> str:
+    """Query a route and store the answer in the lookup cache.
+
+    Only a complete, non-empty answer is cached; one cut short by the
+    timeout is returned to this caller but the next lookup queries again.
+    """
+    response, complete = await execute_bgp_command_with_status(
+        server, f"show ip bgp {destination}"
+    )
+    if complete and response:
+        get_route_cache().set((server, destination), response)
+    return response
+
+
+def _forget_inflight(key: tuple[str, str], task: asyncio.Task) -> None:
+    """Drop a finished lookup from the in-flight map."""
+    if _inflight.get(key) is task:
+        del _inflight[key]
+    if not task.cancelled():
+        # Mark the error retrieved in case every caller was cancelled
+        task.exception()
 
 
 # Create the MCP server
@@ -53,17 +152,24 @@ async def route_lookup(destination: str, server: str = "RouteViews Linx", format
     Returns:
         Route lookup results from the BGP server (text or JSON format).
     """
-    # Validate destination
-    is_valid, message = validate_ip_or_cidr(destination)
-    if not is_valid:
-        error = ErrorResponse(error=message)
-        if format.lower() == "json":
-            return error.model_dump_json(indent=2)
-        return f"Error: {message}"
+    # Validation ignores surrounding whitespace, so the command must too; a
+    # stray newline would send a second command down the session
+    destination = destination.strip()
+
+    # Only validated destinations are ever cached, so a hit needs no checks
+    response = get_route_cache().get((server, destination))
+    if response is None:
+        # Validate destination
+        is_valid, message = validate_ip_or_cidr(destination)
+        if not is_valid:
+            error = ErrorResponse(error=message)
+            if format.lower() == "json":
+                return error.model_dump_json(indent=2)
+            return f"Error: {message}"
 
     try:
-        command = f"show ip bgp {destination}"
-        response = await execute_bgp_command(server, command)
+        if response is None:
+            response = await _lookup_route(server, destination)
         
         # Return JSON format if requested
         if format.lower() == "json":
@@ -142,7 +248,6 @@ async def bgp_summary(server: str = "RouteViews Linx", format: str = "text") ->
         return f"Unexpected error: {type(e).__name__}: {str(e)}"
 
 
-@mcp.tool()
 @mcp.tool()
 def list_servers(format: str = "text") -> str:
     """List all configured BGP looking-glass servers.
@@ -154,46 +259,7 @@ def list_servers(format: str = "text") -> str:
         List of configured servers with their details.
     """
     try:
-        config_data = load_config()
-        servers = config_data.get("servers", [])
-        
-        if not servers:
-            if format.lower() == "json":
-                response = ListServersResponse(servers=[])
-                return response.model_dump_json(indent=2)
-            return "No servers configured."
-        
-        if format.lower() == "json":
-            server_infos = [
-                ServerInfo(
-                    name=server['name'],
-                    host=server['host'],
-                    port=server.get('port', 23),
-                    connection_method=server.get('connection_method', 'unknown'),
-                    enabled=server.get('enabled', True),
-                    supports_ping=server.get('supports_ping', False),
-                    supports_traceroute=server.get('supports_traceroute', False)
-                )
-                for server in servers
-            ]
-            response = ListServersResponse(servers=server_infos)
-            return response.model_dump_json(indent=2)
-        
-        # Text format
-        output = "Configured BGP Looking-Glass Servers:\n"
-        for server in servers:
-            status = "enabled" if server.get("enabled", True) else "disabled"
-            output += f"\n- {server['name']} ({status})\n"
-            output += f"  Host: {server['host']}:{server.get('port', 23)}\n"
-            output += f"  Method: {server.get('connection_method', 'unknown')}\n"
-            
-            # Show ping and traceroute capabilities
-            ping_support = "✓ yes" if server.get('supports_ping', False) else "✗ no"
-            trace_support = "✓ yes" if server.get('supports_traceroute', False) else "✗ no"
-            output += f"  Ping: {ping_support}\n"
-            output += f"  Traceroute: {trace_support}\n"
-        
-        return output
+        return _render_servers(format.lower() == "json")
     except Exception as e:
         error = ErrorResponse(error=f"Error listing servers: {str(e)}")
         if format.lower() == "json":
@@ -201,6 +267,56 @@ def list_servers(format: str = "text") -> str:
         return f"Error listing servers: {str(e)}"
 
 
+@functools.lru_cache(maxsize=2)
+def _render_servers(as_json: bool) -> str:
+    """Render the server list, once per format.
+
+    The configuration is loaded once and not reloaded, so the output
+    never changes for the life of the process.
+    """
+    config_data = load_config()
+    servers = config_data.get("servers", [])
+    
+    if not servers:
+        if as_json:
+            response = ListServersResponse(servers=[])
+            return response.model_dump_json(indent=2)
+        return "No servers configured."
+    
+    if as_json:
+        server_infos = [
+            ServerInfo(
+                name=server['name'],
+                host=server['host'],
+                port=server.get('port', 23),
+                connection_method=server.get('connection_method', 'unknown'),
+                enabled=server.get('enabled', True),
+                supports_ping=server.get('supports_ping', False),
+                supports_traceroute=server.get('supports_traceroute', False)
+            )
+            for server in servers
+        ]
+        response = ListServersResponse(servers=server_infos)
+        return response.model_dump_json(indent=2)
+    
+    # Text format - collect the lines and join once
+    parts = ["Configured BGP Looking-Glass Servers:\n"]
+    for server in servers:
+        status = "enabled" if server.get("enabled", True) else "disabled"
+        # Show ping and traceroute capabilities
+        ping_support = "✓ yes" if server.get('supports_ping', False) else "✗ no"
+        trace_support = "✓ yes" if server.get('supports_traceroute', False) else "✗ no"
+        parts.append(
+            f"\n- {server['name']} ({status})\n"
+            f"  Host: {server['host']}:{server.get('port', 23)}\n"
+            f"  Method: {server.get('connection_method', 'unknown')}\n"
+            f"  Ping: {ping_support}\n"
+            f"  Traceroute: {trace_support}\n"
+        )
+    
+    return "".join(parts)
+
+
 @mcp.tool()
 async def asn_owner(asn: str, format: str = "text") -> str:
     """Look up the owner name for an Autonomous System Number (ASN).
@@ -301,7 +417,8 @@ async def ping_host(ip: str, server: str = "RouteViews Linx", format: str = "tex
     Returns:
         Ping statistics including success rate, packet counts, and round-trip times.
     """
-    # Validate IP
+    # Validate IP, and query the same stripped form that was validated
+    ip = ip.strip()
     is_valid, message = validate_ip_or_cidr(ip)
     if not is_valid:
         error = ErrorResponse(error=message)
@@ -390,7 +507,8 @@ async def traceroute_host(ip: str, server: str = "RouteViews Linx", format: str
     Returns:
         Traceroute results showing hops, hostnames, IPs, ASNs, and response times.
     """
-    # Validate IP
+    # Validate IP, and query the same stripped form that was validated
+    ip = ip.strip()
     is_valid, message = validate_ip_or_cidr(ip)
     if not is_valid:
         error = ErrorResponse(error=message)
@@ -485,24 +603,136 @@ async def traceroute_host(ip: str, server: str = "RouteViews Linx", format: str
         return f"Unexpected error: {type(e).__name__}: {str(e)}"
 
 
-# Create ASGI application for production deployment
-app = mcp.streamable_http_app()
+# FastMCP only accepts requests whose Host header names a local address
+# when it is bound to one of these, as a guard against DNS rebinding
+LOCAL_HOSTS = ("127.0.0.1", "localhost", "::1")
+_LOCAL_TRANSPORT_SECURITY = mcp.settings.transport_security
 
 
-if __name__ == "__main__":
-    # Support environment variables for configuration
+def configure_http(host: str, port: int) -> None:
+    """Set the address the HTTP transports are served on.
+
+    FastMCP fixes its Host header check when the app is built, so this must
+    be called before create_http_app().
+
+    Args:
+        host: Address to listen on.
+        port: Port to listen on.
+    """
+    mcp.settings.host = host
+    mcp.settings.port = port
+    mcp.settings.transport_security = (
+        _LOCAL_TRANSPORT_SECURITY if host in LOCAL_HOSTS else None
+    )
+
+
+def create_http_app(transport: str = "streamable-http") -> Starlette:
+    """Build the ASGI app for an HTTP transport, with pooled looking-glass sessions.
+
+    Args:
+        transport: "streamable-http" or "sse".
+    """
+    if transport == "sse":
+        return with_pool_lifespan(mcp.sse_app())
+    return with_pool_lifespan(mcp.streamable_http_app())
+
+
+def __getattr__(name: str):
+    """Build the ASGI app for production deployment (``uvicorn server:app``).
+
+    It is built on first use rather than at import, so that run_http_server()
+    can set the address first. Served this way, the address is taken from
+    SERVER_HOST and SERVER_PORT.
+    """
+    global app
+
+    if name == "app":
+        configure_http(
+            os.getenv("SERVER_HOST", "127.0.0.1"), int(os.getenv("SERVER_PORT", "8000"))
+        )
+        app = create_http_app()
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+async def run_stdio_server() -> None:
+    """Serve MCP over stdin/stdout with pooled looking-glass sessions."""
+    async with pool_lifespan():
+        await mcp.run_stdio_async()
+
+
+# Transports the server can be started with
+TRANSPORTS = ("stdio", "sse", "streamable-http")
+
+
+def run_http_server(
+    host: str = "127.0.0.1", port: int = 8000, transport: str = "streamable-http"
+) -> None:
+    """Serve MCP over HTTP with pooled looking-glass sessions.
+
+    Args:
+        host: Address to listen on.
+        port: Port to listen on.
+        transport: "streamable-http" or "sse".
+    """
+    import uvicorn
+
+    configure_http(host, port)
+    uvicorn.run(create_http_app(transport), host=host, port=port)
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    """Parse command-line options, defaulting to the environment variables.
+
+    Args:
+        argv: Arguments to parse (defaults to sys.argv[1:]).
+
+    Returns:
+        Parsed options with stdio, transport, host and port set.
+    """
     transport_mode = os.getenv("TRANSPORT_MODE", "streamable-http").lower()
-    server_host = os.getenv("SERVER_HOST", "127.0.0.1")
-    server_port = int(os.getenv("SERVER_PORT", "8000"))
-    
-    # Validate transport mode
-    valid_transports = ["stdio", "sse", "streamable-http"]
-    if transport_mode not in valid_transports:
+    if transport_mode not in TRANSPORTS:
         transport_mode = "streamable-http"
-    
-    # Check for stdio mode (for MCP clients) via argument or environment variable
-    if (len(sys.argv) > 1 and sys.argv[1] == "--stdio") or transport_mode == "stdio":
-        mcp.run()
+
+    parser = argparse.ArgumentParser(description="BGP Looking Glass MCP server")
+    parser.add_argument(
+        "--stdio",
+        action="store_true",
+        help="serve over stdin/stdout (for local MCP clients)",
+    )
+    parser.add_argument(
+        "--transport",
+        choices=TRANSPORTS,
+        default=transport_mode,
+        help="transport to serve (default: $TRANSPORT_MODE or streamable-http)",
+    )
+    parser.add_argument(
+        "--host",
+        default=os.getenv("SERVER_HOST", "127.0.0.1"),
+        help="address to listen on for HTTP (default: $SERVER_HOST or 127.0.0.1)",
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=int(os.getenv("SERVER_PORT", "8000")),
+        help="port to listen on for HTTP (default: $SERVER_PORT or 8000)",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    """Run the server with the transport chosen on the command line.
+
+    Args:
+        argv: Arguments to parse (defaults to sys.argv[1:]).
+    """
+    args = parse_args(argv)
+    if args.stdio or args.transport == "stdio":
+        run_event_loop(run_stdio_server())
     else:
         # Start an HTTP server (default: streamable-http)
-        mcp.run(transport=transport_mode)  # type: ignore
+        run_http_server(args.host, args.port, args.transport)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,21 @@
+"""Shared fixtures: a clean pool, cache and config for every test."""
+
+import pytest
+
+import bgp_lg
+
+
+@pytest.fixture
+def configure(monkeypatch):
+    """Point the module-level config at the given server entries.
+
+    The global pool and route cache are reset so tests don't share sessions.
+    """
+    monkeypatch.setattr(bgp_lg, "_pool", None)
+    monkeypatch.setattr(bgp_lg, "_route_cache", None)
+
+    def configure(*servers: dict) -> None:
+        monkeypatch.setattr(bgp_lg, "_config", {"servers": list(servers)})
+        monkeypatch.setattr(bgp_lg, "_config_by_name", {s["name"]: s for s in servers})
+
+    return configure
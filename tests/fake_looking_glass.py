@@ -0,0 +1,101 @@
+"""A minimal telnet looking-glass server for exercising the client and pool."""
+
+import asyncio
+import re
+from typing import Optional
+
+# Telnet negotiation as a router sends it: DO ECHO, WILL SUPPRESS-GO-AHEAD
+# and a terminal-type subnegotiation
+NEGOTIATION = b"\xff\xfd\x01\xff\xfb\x03\xff\xfa\x18\x01\xff\xf0"
+# The same options offered again in the middle of a command's output
+RENEGOTIATION = b"\xff\xfb\x01"
+# A client's WONT/DONT (or WILL/DO) replies
+_REPLY = re.compile(rb"\xff[\xfb-\xfe].")
+
+
+class FakeLookingGlass:
+    """Answers "show ip bgp <prefix>" with a one-line route entry.
+
+    Args:
+        close_after: Hang up after this many commands on each connection.
+        stall: Commands answered with a partial line and then silence,
+            until stall_released is set.
+        negotiate: Send telnet negotiation with the banner and in each
+            route entry, and collect the client's replies in replies.
+    """
+
+    PROMPT = b"route-views>"
+
+    def __init__(
+        self, close_after: Optional[int] = None, stall: tuple = (), negotiate: bool = False
+    ):
+        self.close_after = close_after
+        self.stall = stall
+        self.negotiate = negotiate
+        self.stall_released = asyncio.Event()
+        self.connections = 0
+        self.commands: list[str] = []
+        self.replies: list[bytes] = []
+        self.port = 0
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def __aenter__(self) -> "FakeLookingGlass":
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        self.stall_released.set()
+        self._server.close()
+
+    def server_config(self, name: str = "Fake") -> dict:
+        """Build a config.json-style server entry pointing at this server."""
+        return {
+            "name": name,
+            "host": "127.0.0.1",
+            "port": self.port,
+            "connection_method": "telnet",
+            "username": "",
+            "password": "",
+            "prompt": ">",
+            "timeout": 2,
+            "enabled": True,
+        }
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        if self.negotiate:
+            writer.write(NEGOTIATION)
+        writer.write(b"Welcome to the fake looking glass\r\n" + self.PROMPT)
+        answered = 0
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    return
+                # Replies to negotiation arrive ahead of the next command
+                self.replies.extend(_REPLY.findall(line))
+                command = _REPLY.sub(b"", line).strip().decode()
+                self.commands.append(command)
+                writer.write(command.encode() + b"\r\n")
+                if command in self.stall:
+                    writer.write(b"*> partial line 1")
+                    await writer.drain()
+                    await self.stall_released.wait()
+                    writer.write(b"\r\n*> line 2\r\n")
+                elif command.startswith("show ip bgp "):
+                    prefix = command.rsplit(" ", 1)[1]
+                    entry = f"BGP routing table entry for {prefix}\r\n".encode()
+                    if self.negotiate:
+                        entry = entry[:3] + RENEGOTIATION + entry[3:]
+                    writer.write(entry)
+                writer.write(self.PROMPT)
+                await writer.drain()
+
+                answered += 1
+                if self.close_after is not None and answered >= self.close_after:
+                    return
+        except ConnectionError:
+            return
+        finally:
+            writer.close()
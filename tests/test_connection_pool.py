@@ -0,0 +1,246 @@
+"""Tests for session pooling and reuse in bgp_lg."""
+
+import asyncio
+
+import pytest
+
+import bgp_lg
+import server
+from tests.fake_looking_glass import FakeLookingGlass
+
+
+async def test_sessions_are_reused(configure):
+    async with FakeLookingGlass() as fake:
+        configure(fake.server_config())
+        try:
+            for prefix in ("1.1.1.1", "9.9.9.9", "8.8.8.8"):
+                response = await bgp_lg.execute_bgp_command("Fake", f"show ip bgp {prefix}")
+                assert f"entry for {prefix}" in response
+        finally:
+            await bgp_lg.close_pool()
+
+    assert fake.connections == 1
+
+
+async def test_session_dropped_by_server_is_replaced(configure):
+    async with FakeLookingGlass(close_after=1) as fake:
+        configure(fake.server_config())
+        try:
+            for prefix in ("1.1.1.1", "9.9.9.9", "8.8.8.8"):
+                response = await bgp_lg.execute_bgp_command("Fake", f"show ip bgp {prefix}")
+                assert f"entry for {prefix}" in response
+        finally:
+            await bgp_lg.close_pool()
+
+    assert fake.connections == 3
+
+
+async def test_dropped_session_is_not_reusable():
+    async with FakeLookingGlass(close_after=1) as fake:
+        pool = bgp_lg.ConnectionPool()
+        client = await pool.acquire(fake.server_config())
+        await client.send_command("show ip bgp 1.1.1.1")
+        for _ in range(100):
+            if client.reader.at_eof():
+                break
+            await asyncio.sleep(0.01)
+
+        # The transport is still half-open, so only the reader shows it
+        assert not client.writer.is_closing()
+        assert not client.is_reusable()
+        await pool.discard(client)
+        await pool.close_all()
+
+
+async def test_session_with_unread_output_is_not_reused(configure):
+    async with FakeLookingGlass() as fake:
+        configure(fake.server_config())
+        pool = bgp_lg.get_pool()
+        try:
+            # A stray newline makes the server answer a second, empty command
+            # that nothing reads
+            client = await pool.acquire(fake.server_config())
+            await client.send_command("show ip bgp 1.1.1.1")
+            client.writer.write(b"\n")
+            for _ in range(100):
+                if client.has_unread_output():
+                    break
+                await asyncio.sleep(0.01)
+            assert not client.is_reusable()
+            await pool.release(client)
+
+            response = await bgp_lg.execute_bgp_command("Fake", "show ip bgp 9.9.9.9")
+            assert "entry for 9.9.9.9" in response
+        finally:
+            await bgp_lg.close_pool()
+
+    assert fake.connections == 2
+
+
+async def test_multiline_commands_are_rejected(configure):
+    async with FakeLookingGlass() as fake:
+        configure(fake.server_config())
+        with pytest.raises(ValueError):
+            await bgp_lg.execute_bgp_command("Fake", "show ip bgp 1.1.1.1\nshow ip bgp 2.2.2.2")
+
+    assert fake.connections == 0
+
+
+async def test_route_lookup_sends_the_stripped_destination(configure, monkeypatch):
+    monkeypatch.setattr(server, "_inflight", {})
+    async with FakeLookingGlass() as fake:
+        configure(fake.server_config())
+        try:
+            first = await server.route_lookup("8.8.8.8\n", "Fake")
+            second = await server.route_lookup("9.9.9.9", "Fake")
+        finally:
+            await bgp_lg.close_pool()
+
+    assert "entry for 8.8.8.8" in first
+    assert "entry for 9.9.9.9" in second
+    assert fake.commands == ["show ip bgp 8.8.8.8", "show ip bgp 9.9.9.9"]
+
+
+async def test_acquire_waits_for_a_released_session():
+    async with FakeLookingGlass() as fake:
+        pool = bgp_lg.ConnectionPool(max_connections=1, pool_timeout=1)
+        config = fake.server_config()
+        first = await pool.acquire(config)
+
+        waiter = asyncio.create_task(pool.acquire(config))
+        await asyncio.sleep(0.05)
+        assert not waiter.done()
+
+        await pool.release(first)
+        assert await waiter is first
+        await pool.release(first)
+        await pool.close_all()
+
+    assert fake.connections == 1
+
+
+async def test_acquire_times_out_when_all_sessions_are_busy():
+    async with FakeLookingGlass() as fake:
+        pool = bgp_lg.ConnectionPool(max_connections=1, pool_timeout=0.1)
+        config = fake.server_config()
+        client = await pool.acquire(config)
+
+        with pytest.raises(ConnectionError):
+            await pool.acquire(config)
+
+        await pool.release(client)
+        await pool.close_all()
+
+
+async def test_idle_sessions_expire():
+    async with FakeLookingGlass() as fake:
+        pool = bgp_lg.ConnectionPool(idle_timeout=0.05)
+        client = await pool.acquire(fake.server_config())
+        await pool.release(client)
+        assert len(pool._servers[client.pool_key].idle) == 1
+
+        await asyncio.sleep(0.1)
+        pool._evict_stale(client.pool_key)
+        assert client.pool_key not in pool._servers
+        await pool.close_all()
+
+
+async def test_complete_route_lookups_are_cached(configure, monkeypatch):
+    monkeypatch.setattr(server, "_inflight", {})
+    async with FakeLookingGlass() as fake:
+        configure(fake.server_config())
+        try:
+            first = await server.route_lookup("8.8.8.8", "Fake")
+            second = await server.route_lookup("8.8.8.8", "Fake")
+        finally:
+            await bgp_lg.close_pool()
+
+    assert first == second
+    assert fake.commands == ["show ip bgp 8.8.8.8"]
+
+
+async def test_truncated_route_lookups_are_not_cached(configure, monkeypatch):
+    monkeypatch.setattr(server, "_inflight", {})
+    async with FakeLookingGlass(stall=("show ip bgp 8.8.8.8",)) as fake:
+        config = fake.server_config()
+        config["timeout"] = 0.2
+        configure(config)
+        try:
+            truncated = await server.route_lookup("8.8.8.8", "Fake")
+            assert "partial line 1" in truncated
+            assert "line 2" not in truncated
+            assert bgp_lg.get_route_cache().get(("Fake", "8.8.8.8")) is None
+
+            fake.stall_released.set()
+            complete = await server.route_lookup("8.8.8.8", "Fake")
+        finally:
+            await bgp_lg.close_pool()
+
+    assert "line 2" in complete
+    assert fake.commands == ["show ip bgp 8.8.8.8", "show ip bgp 8.8.8.8"]
+
+
+async def test_telnet_negotiation_is_answered_and_stripped(configure):
+    async with FakeLookingGlass(negotiate=True) as fake:
+        configure(fake.server_config())
+        pool = bgp_lg.get_pool()
+        try:
+            client = await pool.acquire(fake.server_config())
+            response = await client.send_command("show ip bgp 8.8.8.8")
+            assert "\xff" not in response
+            assert "BGP routing table entry for 8.8.8.8" in response
+            # Every byte passed to the reader was consumed by the read
+            assert client.is_reusable()
+            await pool.release(client)
+
+            response = await bgp_lg.execute_bgp_command("Fake", "show ip bgp 9.9.9.9")
+            assert "BGP routing table entry for 9.9.9.9" in response
+        finally:
+            await bgp_lg.close_pool()
+
+    assert fake.connections == 1
+    # WONT ECHO and DONT SUPPRESS-GO-AHEAD for the banner, then DONT ECHO for
+    # the first entry, sent ahead of the second command
+    assert fake.replies[:3] == [b"\xff\xfc\x01", b"\xff\xfe\x03", b"\xff\xfe\x01"]
+
+
+async def test_concurrent_route_lookups_share_one_query(configure, monkeypatch):
+    monkeypatch.setattr(server, "_inflight", {})
+    async with FakeLookingGlass(stall=("show ip bgp 8.8.8.8",)) as fake:
+        configure(fake.server_config())
+        try:
+            lookups = [
+                asyncio.create_task(server.route_lookup("8.8.8.8", "Fake")) for _ in range(5)
+            ]
+            await asyncio.sleep(0.05)
+            fake.stall_released.set()
+            responses = await asyncio.gather(*lookups)
+        finally:
+            await bgp_lg.close_pool()
+
+    assert all("line 2" in response for response in responses)
+    assert fake.commands == ["show ip bgp 8.8.8.8"]
+    assert fake.connections == 1
+    assert server._inflight == {}
+
+
+async def test_cancelled_caller_does_not_cancel_a_shared_lookup(configure, monkeypatch):
+    monkeypatch.setattr(server, "_inflight", {})
+    async with FakeLookingGlass(stall=("show ip bgp 8.8.8.8",)) as fake:
+        configure(fake.server_config())
+        try:
+            first = asyncio.create_task(server.route_lookup("8.8.8.8", "Fake"))
+            second = asyncio.create_task(server.route_lookup("8.8.8.8", "Fake"))
+            await asyncio.sleep(0.05)
+
+            first.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await first
+            fake.stall_released.set()
+            response = await second
+        finally:
+            await bgp_lg.close_pool()
+
+    assert "line 2" in response
+    assert fake.commands == ["show ip bgp 8.8.8.8"]
+    assert server._inflight == {}
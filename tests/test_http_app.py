@@ -0,0 +1,123 @@
+"""Tests for serving the MCP server over HTTP."""
+
+import asyncio
+import logging
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import bgp_lg
+import server
+from tests.fake_looking_glass import FakeLookingGlass
+
+# Sends an MCP initialize request with a remote Host header. The app is
+# built in a separate process, since FastMCP keeps one per process
+INITIALIZE = """
+import sys
+
+from starlette.testclient import TestClient
+
+import server
+
+if sys.argv[1] == "configure":
+    server.configure_http("0.0.0.0", 8000)
+    http_app = server.create_http_app()
+else:
+    http_app = server.app
+
+request = {
+    "jsonrpc": "2.0",
+    "id": 1,
+    "method": "initialize",
+    "params": {
+        "protocolVersion": "2025-03-26",
+        "capabilities": {},
+        "clientInfo": {"name": "test", "version": "1"},
+    },
+}
+with TestClient(http_app, base_url="http://lg.example.net:8000") as client:
+    response = client.post(
+        "/mcp", json=request, headers={"Accept": "application/json, text/event-stream"}
+    )
+print(response.status_code)
+"""
+
+
+def initialize(how: str, **overrides: str) -> int:
+    """Run INITIALIZE and return the response status."""
+    env = {**os.environ, "BGP_PREWARM_SESSIONS": "0"}
+    env.pop("SERVER_HOST", None)
+    env.update(overrides)
+    result = subprocess.run(
+        [sys.executable, "-c", INITIALIZE, how],
+        cwd=Path(__file__).parent.parent,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=60,
+        check=True,
+    )
+    return int(result.stdout.split()[-1])
+
+
+def test_remote_host_header_is_accepted_when_bound_elsewhere():
+    assert initialize("configure") == 200
+
+
+def test_app_takes_its_address_from_the_environment():
+    assert initialize("app", SERVER_HOST="0.0.0.0") == 200
+
+
+def test_remote_host_header_is_rejected_when_bound_locally():
+    assert initialize("app", SERVER_HOST="127.0.0.1") == 421
+
+
+async def test_prewarm_failure_is_logged(monkeypatch, caplog):
+    monkeypatch.setattr(bgp_lg, "_pool", None)
+    monkeypatch.setattr(bgp_lg, "_config", None)
+    monkeypatch.setattr(bgp_lg, "_config_path", Path("/nonexistent/config.json"))
+    monkeypatch.setenv("BGP_PREWARM_SESSIONS", "1")
+
+    with caplog.at_level(logging.ERROR, logger="server"):
+        async with server.pool_lifespan():
+            await asyncio.sleep(0.05)
+
+    assert "Failed to pre-warm sessions" in caplog.text
+
+
+async def test_shutdown_waits_for_prewarm(configure, monkeypatch):
+    monkeypatch.setenv("BGP_PREWARM_SESSIONS", "2")
+    async with FakeLookingGlass() as fake:
+        configure(fake.server_config())
+        # Shut down while the logins are still under way. Nothing may be
+        # left running that could still add a session to the closed pool
+        async with server.pool_lifespan():
+            await asyncio.sleep(0)
+        leftover = asyncio.all_tasks() - {asyncio.current_task()}
+
+    assert leftover == set()
+    assert bgp_lg._pool is None
+
+
+def test_main_serves_the_transport_from_the_command_line(monkeypatch):
+    calls = []
+    monkeypatch.setattr(server, "run_http_server", lambda *args: calls.append(args))
+    monkeypatch.setenv("TRANSPORT_MODE", "sse")
+
+    server.main(["--host", "0.0.0.0", "--port", "9000"])
+    assert calls == [("0.0.0.0", 9000, "sse")]
+
+
+def test_main_serves_stdio(monkeypatch):
+    served = []
+
+    def run_event_loop(main):
+        served.append(main.__qualname__)
+        main.close()
+
+    monkeypatch.setattr(server, "run_event_loop", run_event_loop)
+    server.main(["--stdio"])
+    assert served == ["run_stdio_server"]
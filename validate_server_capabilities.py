@@ -4,10 +4,9 @@ Validate which route servers actually support ping and traceroute commands.
 This script connects to each server and tests if the commands work.
 """
 
-import asyncio
 import json
 import sys
-from bgp_lg import execute_bgp_command
+from bgp_lg import close_pool, execute_bgp_command, run_event_loop
 
 
 async def test_server_capabilities(server_name: str) -> dict:
@@ -70,14 +69,19 @@ async def main():
     print("=" * 80)
     print(f"\nTesting {len(servers)} servers for ping and traceroute support...\n")
     
-    for server in servers:
-        server_name = server.get("name")
-        if not server.get("enabled", True):
-            print(f"  SKIPPED: {server_name} (disabled)")
-            continue
-        
-        result = await test_server_capabilities(server_name)
-        all_results.append(result)
+    # Ping and traceroute share a pooled session per server; log them all
+    # out once every server has been tested
+    try:
+        for server in servers:
+            server_name = server.get("name")
+            if not server.get("enabled", True):
+                print(f"  SKIPPED: {server_name} (disabled)")
+                continue
+            
+            result = await test_server_capabilities(server_name)
+            all_results.append(result)
+    finally:
+        await close_pool()
     
     # Print summary
     print("\n" + "=" * 80)
@@ -112,4 +116,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run_event_loop(main())